@@ -0,0 +1,102 @@
+# ================================
+# COMPILED INFERENCE KERNELS
+# ================================
+
+# These functions re-implement model inference on plain NumPy arrays
+# extracted from the trained models at startup. Numba compiles them to
+# machine code, so a prediction is a tight native loop instead of a trip
+# through sklearn's Python/Cython dispatch and input validation.
+
+import math
+
+import numpy as np
+from numba import config, njit, prange
+
+# Batch kernels run on Starlette's worker threads, so several requests can
+# enter a parallel kernel at once. Numba's default "workqueue" layer is not
+# safe for that; require TBB or OpenMP (tbb is in requirements.txt).
+config.THREADING_LAYER = "threadsafe"
+
+
+@njit(cache=True, nogil=True)
+def jit_walk_tree(x, feature, threshold, children_left, children_right, leaf_class):
+    """
+    Follows one row from the root of a fitted decision tree to a leaf
+    and returns that leaf's class label.
+
+    Uses the same rule as sklearn: go left when x[feature] <= threshold.
+    Leaves are the nodes whose left child is -1.
+    """
+    node = 0
+    while children_left[node] != -1:
+        if x[feature[node]] <= threshold[node]:
+            node = children_left[node]
+        else:
+            node = children_right[node]
+    return leaf_class[node]
+
+
+@njit(cache=True, nogil=True, parallel=True)
+def jit_walk_tree_batch(X, feature, threshold, children_left, children_right, leaf_class):
+    """
+    Runs jit_walk_tree over every row of X, splitting rows across CPU cores.
+    """
+    out = np.empty(X.shape[0], dtype=np.int32)
+    for i in prange(X.shape[0]):
+        out[i] = jit_walk_tree(
+            X[i], feature, threshold, children_left, children_right, leaf_class
+        )
+    return out
+
+
+@njit(cache=True, nogil=True, fastmath=True)
+def svm_decision_linear(X, coef, intercept):
+    """
+    Linear-kernel SVM decision score for each row of X:
+    x . coef + intercept.
+    """
+    out = np.empty(X.shape[0], dtype=np.float64)
+    for i in range(X.shape[0]):
+        score = intercept
+        for j in range(X.shape[1]):
+            score += X[i, j] * coef[j]
+        out[i] = score
+    return out
+
+
+@njit(cache=True, nogil=True, fastmath=True, parallel=True)
+def svm_decision_rbf(X, support_vectors, dual_coef, feature_weight, intercept, gamma):
+    """
+    RBF-kernel SVM decision score for each row of X:
+    sum_k dual_coef[k] * exp(-gamma * d(sv_k, x)) + intercept,
+    where d is the squared distance with each feature j scaled by
+    feature_weight[j] (this lets feature standardization be folded in).
+
+    Rows are split across CPU cores.
+    """
+    out = np.empty(X.shape[0], dtype=np.float64)
+    for i in prange(X.shape[0]):
+        score = intercept
+        for k in range(support_vectors.shape[0]):
+            dist = 0.0
+            for j in range(support_vectors.shape[1]):
+                diff = support_vectors[k, j] - X[i, j]
+                dist += feature_weight[j] * diff * diff
+            score += dual_coef[k] * math.exp(-gamma * dist)
+        out[i] = score
+    return out
+
+
+# Prefer the ahead-of-time compiled single-row walk from build_kernels.py
+# when it has been built: it imports as ready machine code instead of
+# being JIT-compiled. Otherwise fall back to the JIT version above.
+#
+# The batch walk always stays JIT: pycc can't compile prange, and its
+# exports don't release the GIL, so an AOT batch walk would run serially
+# and block other worker threads.
+try:
+    from app.cervix_kernels import walk_tree
+except ImportError:
+    walk_tree = jit_walk_tree
+
+walk_tree_batch = jit_walk_tree_batch
@@ -3,33 +3,214 @@
 # ================================
 
 # FastAPI: Web framework for building APIs
-from fastapi import FastAPI, HTTPException, Request
+from fastapi import FastAPI, HTTPException, Request, Response
 
 # CORS: Allows frontend (Vercel) to communicate with backend (Render)
 from fastapi.middleware.cors import CORSMiddleware
 
+# GZip: Compresses large (batch) responses
+from fastapi.middleware.gzip import GZipMiddleware
+
 # Pydantic: Validates incoming JSON request bodies
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, conlist, create_model
+from typing import Annotated, List
+from typing_extensions import TypedDict
 
 # joblib: Loads trained machine learning models and artifacts
 import joblib
 
-# SlowAPI: Rate limiting to protect against abuse
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
+# NumPy: Fast numeric arrays used for inference
+import numpy as np
+
+# threading: Per-thread scratch buffers for concurrent requests
+import threading
+
+# warnings: Startup notices that should not stop the server
+import warnings
+
+# operator: C-level itemgetter for pulling features out of request dicts
+import operator
+
+# functools: Memoizes repeated predictions
+import functools
+
+# sys: Interns feature names for identity-based dict lookups
+import sys
+
+# Numba-compiled inference kernels
+from app.kernels import (
+    walk_tree, walk_tree_batch, svm_decision_linear, svm_decision_rbf
+)
+
+# Rate limiting: per-IP sliding window of request timestamps
+import time
+from collections import deque
 
 # Used to return custom JSON error responses
 from fastapi.responses import JSONResponse
 
+# orjson: Fast JSON parsing/serialization (Rust, SIMD)
+import orjson
+from fastapi.routing import APIRoute
+
+# Runs blocking model inference off the event loop
+from starlette.concurrency import run_in_threadpool
+import asyncio
+import os
+from contextlib import asynccontextmanager
+
 
 # ================================
 # INITIALIZE RATE LIMITER
 # ================================
 
-# Uses client IP address as the rate-limit key
-limiter = Limiter(key_func=get_remote_address)
+# Each endpoint allows RATE_LIMIT requests per RATE_WINDOW seconds per IP
+RATE_LIMIT = 10
+RATE_WINDOW = 60.0
+
+# Drop idle buckets once this many client IPs are being tracked
+RATE_MAX_BUCKETS = 10_000
+
+
+class RateBucket:
+    """
+    Timestamps of one client's most recent requests to one endpoint.
+    """
+    __slots__ = ("ts",)
+
+    def __init__(self):
+        self.ts = deque(maxlen=RATE_LIMIT)
+
+
+# (path, client IP) -> RateBucket. Endpoints are async and check the
+# limit before any await, so all access happens on the event loop thread
+# and needs no lock. Each uvicorn worker keeps its own buckets.
+_rate_buckets = {}
+
+
+def bucket_allow(key) -> bool:
+    """
+    Records a request for `key` and returns False if it
+    exceeds the limit for the current window.
+    """
+    now = time.monotonic()
+
+    bucket = _rate_buckets.get(key)
+    if bucket is None:
+        if len(_rate_buckets) >= RATE_MAX_BUCKETS:
+            _prune_rate_buckets(now)
+        bucket = _rate_buckets[key] = RateBucket()
+
+    # Forget requests that have left the window
+    ts = bucket.ts
+    while ts and now - ts[0] >= RATE_WINDOW:
+        ts.popleft()
+
+    if len(ts) >= RATE_LIMIT:
+        return False
+
+    ts.append(now)
+    return True
+
+
+def _prune_rate_buckets(now: float):
+    """
+    Removes buckets whose newest request is outside the window,
+    so the table can't grow without bound.
+    """
+    stale = [
+        key for key, bucket in _rate_buckets.items()
+        if not bucket.ts or now - bucket.ts[-1] >= RATE_WINDOW
+    ]
+    for key in stale:
+        del _rate_buckets[key]
+
+
+def check_rate_limit(request: Request):
+    """
+    Rejects the request with 429 if this client has used up
+    its allowance for this endpoint.
+    """
+    host = request.client.host if request.client else "127.0.0.1"
+
+    if not bucket_allow((request.url.path, host)):
+        raise HTTPException(
+            status_code=429,
+            detail="Too many requests. Please try again later."
+        )
+
+
+# ================================
+# FAST JSON (ORJSON)
+# ================================
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson instead of the stdlib encoder.
+    """
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+class ORJSONRequest(Request):
+    """
+    Request whose JSON body is parsed with orjson.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so FastAPI
+    still turns malformed bodies into its usual 422 response.
+    """
+    async def json(self):
+        if not hasattr(self, "_json"):
+            self._json = orjson.loads(await self.body())
+        return self._json
+
+
+class ORJSONRoute(APIRoute):
+    """
+    Route class that hands endpoints an ORJSONRequest, so
+    FastAPI's body parsing goes through orjson.
+    """
+    def get_route_handler(self):
+        original_handler = super().get_route_handler()
+
+        async def orjson_route_handler(request: Request):
+            return await original_handler(ORJSONRequest(request.scope, request.receive))
+
+        return orjson_route_handler
+
+
+# ================================
+# SVM MICRO-BATCHING (OPTIONAL)
+# ================================
+
+# Optional micro-batching of concurrent single-row SVM requests: wait up to
+# SVM_MICROBATCH_MS for up to SVM_MICROBATCH_SIZE requests and score them
+# in one call. 0 (default) scores each request immediately, which is best
+# for the current linear model; batching pays off for heavier kernels
+# under concurrent load.
+SVM_MICROBATCH_MS = float(os.environ.get("SVM_MICROBATCH_MS", "0"))
+SVM_MICROBATCH_SIZE = int(os.environ.get("SVM_MICROBATCH_SIZE", "32"))
+
+_svm_batcher = None
+
+
+@asynccontextmanager
+async def lifespan(app):
+    """
+    Starts the SVM micro-batcher (if enabled) with the
+    server and stops it on shutdown.
+    """
+    global _svm_batcher
+
+    if SVM_MICROBATCH_MS > 0:
+        _svm_batcher = SvmMicroBatcher(SVM_MICROBATCH_SIZE, SVM_MICROBATCH_MS / 1000)
+        _svm_batcher.start()
+
+    yield
+
+    if _svm_batcher is not None:
+        await _svm_batcher.stop()
+        _svm_batcher = None
 
 
 # ================================
@@ -39,23 +220,42 @@ limiter = Limiter(key_func=get_remote_address)
 app = FastAPI(
     title="Cervical Cancer Prediction API",
     description="Predict cervical cancer risk using SVM and Decision Tree models",
-    version="1.0"
+    version="1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Attach limiter to the app state
-app.state.limiter = limiter
-
-# Enable rate-limiting middleware
-app.add_middleware(SlowAPIMiddleware)
+# Parse every request body with orjson (must be set before routes are added)
+app.router.route_class = ORJSONRoute
 
 
 # ================================
 # CONFIGURE CORS (SECURITY)
 # ================================
 
+class BrowserCORSMiddleware(CORSMiddleware):
+    """
+    CORS middleware that steps aside for requests without an Origin header.
+
+    CORS only applies to browsers, which always send Origin on cross-site
+    requests. Server-to-server callers don't, so their requests go straight
+    to the app without the middleware parsing headers.
+    """
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            for name, _ in scope["headers"]:
+                if name == b"origin":
+                    break
+            else:
+                await self.app(scope, receive, send)
+                return
+
+        await super().__call__(scope, receive, send)
+
+
 # Only allow requests from known frontends
 app.add_middleware(
-    CORSMiddleware,
+    BrowserCORSMiddleware,
     allow_origins=[
         "http://localhost:5173",                         # Local development
         "https://cervical-cancer-prediction.vercel.app"  # Production frontend
@@ -66,25 +266,249 @@ app.add_middleware(
 )
 
 
+# ================================
+# RESPONSE COMPRESSION
+# ================================
+
+# Batch responses grow with the number of rows, and their repetitive JSON
+# compresses very well. Single predictions stay under minimum_size and
+# are sent as-is, where compressing would cost more than it saves.
+# Level 1 is the cheapest setting and still shrinks batch output ~5x.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
+
 # ================================
 # LOAD TRAINED MODEL ARTIFACTS
 # ================================
 
+def load_artifact(path: str):
+    """
+    Loads a joblib artifact with its NumPy arrays memory-mapped read-only.
+
+    The artifacts are saved uncompressed, so the arrays inside them
+    (support vectors, tree nodes, scaler stats) are mapped straight from
+    disk instead of copied when loading. Requests don't read these
+    objects: they use the small private arrays derived from them below,
+    and the mapped pages are only touched by the startup checks.
+    """
+    return joblib.load(path, mmap_mode="r")
+
+
 # ---- SVM artifacts ----
-svm_model = joblib.load("model_store/svm/model.pkl")
-svm_scaler = joblib.load("model_store/svm/scaler.pkl")
-svm_features = joblib.load("model_store/svm/features.pkl")
+svm_model = load_artifact("model_store/svm/model.pkl")
+svm_scaler = load_artifact("model_store/svm/scaler.pkl")
+svm_features = load_artifact("model_store/svm/features.pkl")
 
 # ---- Decision Tree artifacts ----
-dt_model = joblib.load("model_store/dt/model.pkl")
-dt_features = joblib.load("model_store/dt/features.pkl")
+dt_model = load_artifact("model_store/dt/model.pkl")
+dt_features = load_artifact("model_store/dt/features.pkl")
+
+# Intern the feature names. The request schemas, itemgetters and error
+# messages below are all built from these exact string objects, so the
+# keys of a validated request dict match them by pointer and dict lookups
+# skip the string comparison.
+svm_features = [sys.intern(f) for f in svm_features]
+dt_features = [sys.intern(f) for f in dt_features]
+
+# Fetch every feature, in training order, with a single C-level call
+_svm_getter = operator.itemgetter(*svm_features)
+_dt_getter = operator.itemgetter(*dt_features)
+
+
+# ================================
+# PER-THREAD INPUT BUFFERS
+# ================================
+
+# Each thread gets its own preallocated (1, n_features) float32 input
+# buffer per model, so single-row requests fill it in place instead of
+# allocating a new array, and concurrent requests never share one
+_scratch = threading.local()
+
+
+def scratch_buffer(name: str, n_features: int):
+    """
+    Returns this thread's reusable input buffer for the given model.
+    """
+    buf = getattr(_scratch, name, None)
+    if buf is None:
+        buf = np.empty((1, n_features), dtype=np.float32)
+        setattr(_scratch, name, buf)
+    return buf
+
+
+# ================================
+# PRECOMPUTED SVM DECISION FUNCTION
+# ================================
+
+# For a binary SVC, sklearn predicts classes_[1] when
+#   sum_i dual_coef_i * K(sv_i, x) + intercept > 0
+# Pulling these arrays out once lets us evaluate that directly with
+# compiled kernels instead of going through libsvm's per-call setup.
+#
+# The model was trained on StandardScaler output z = (x - mean) / scale.
+# That transform is folded into the cached parameters, so requests are
+# scored on raw input with no per-request scaling step:
+#   linear: w.z + b = (w / scale).x + (b - (w / scale).mean)
+#   rbf:    ||sv - z||^2 = sum_j (sv'_j - x_j)^2 / scale_j^2,
+#           with sv' = sv * scale + mean (the SVs in raw units)
+if len(svm_model.classes_) != 2:
+    raise RuntimeError("Inline SVM decision only supports binary models")
+
+_svm_classes = svm_model.classes_.astype(np.int32)
+_svm_kernel = svm_model.kernel
+
+if _svm_kernel == "rbf":
+    _svm_gamma = float(svm_model._gamma)
+elif _svm_kernel != "linear":
+    raise RuntimeError(f"Inline SVM decision does not support kernel '{_svm_kernel}'")
+
+
+def _set_svm_precision(dtype):
+    """
+    (Re)builds the cached SVM arrays, with scaling folded in,
+    in the given float dtype.
+    """
+    global _svm_sv, _svm_dual, _svm_coef, _svm_intercept, _svm_feature_weight
+
+    sv = np.asarray(svm_model.support_vectors_, dtype=np.float64)
+    dual = np.asarray(svm_model.dual_coef_[0], dtype=np.float64)
+    intercept = float(svm_model.intercept_[0])
+    mean = np.asarray(svm_scaler.mean_, dtype=np.float64)
+    scale = np.asarray(svm_scaler.scale_, dtype=np.float64)
+
+    # Linear kernel collapses to a single weight vector (== coef_[0]);
+    # the mean shift moves into its intercept
+    coef = (dual @ sv) / scale
+    _svm_coef = coef.astype(dtype)
+    if _svm_kernel == "linear":
+        _svm_intercept = intercept - float(coef @ mean)
+    else:
+        _svm_intercept = intercept
+
+    # Support vectors in raw units; keep them C-contiguous so each
+    # row is read sequentially
+    _svm_sv = np.ascontiguousarray(sv * scale + mean, dtype=dtype)
+    _svm_dual = dual.astype(dtype)
+    _svm_feature_weight = (1.0 / scale ** 2).astype(dtype)
+
+
+def svm_decision(X):
+    """
+    Returns the SVM decision score for each row of the
+    raw (unscaled) (n_rows, n_features) matrix X.
+
+    The compiled kernels release the GIL, so batches scored on
+    worker threads really do run in parallel.
+    """
+    if _svm_kernel == "linear":
+        return svm_decision_linear(X, _svm_coef, _svm_intercept)
+
+    return svm_decision_rbf(
+        X, _svm_sv, _svm_dual, _svm_feature_weight, _svm_intercept, _svm_gamma
+    )
+
+
+def svm_predict(X):
+    """
+    Returns predicted class labels for the raw rows of X.
+    """
+    return _svm_classes[(svm_decision(X) > 0).astype(np.intp)]
+
+
+# Serve in float32: it halves the memory traffic of the kernel evaluation
+# and request inputs are already float32. Before committing to it, check
+# that it reproduces sklearn's own scaler + model on the support vectors
+# (the points closest to the decision boundary); if any flips, stay float64.
+_svm_check_X = svm_scaler.inverse_transform(
+    np.asarray(svm_model.support_vectors_)
+).astype(np.float32)
+_svm_check_y = svm_model.predict(svm_scaler.transform(_svm_check_X)).astype(np.int32)
+
+_set_svm_precision(np.float32)
+if not np.array_equal(svm_predict(_svm_check_X), _svm_check_y):
+    warnings.warn("float32 SVM disagrees with sklearn; falling back to float64")
+    _set_svm_precision(np.float64)
+
+    # A mismatch in float64 too means the folded parameters or the
+    # decision function are wrong, not the precision
+    if not np.array_equal(svm_predict(_svm_check_X), _svm_check_y):
+        raise RuntimeError("SVM decision function disagrees with svm_model.predict")
+
+
+# ================================
+# PRECOMPUTED DECISION TREE ARRAYS
+# ================================
+
+# The saved model is an imblearn Pipeline (SMOTE -> DecisionTreeClassifier).
+# Samplers only act during fit, so prediction is just the final tree.
+if any(not hasattr(step, "fit_resample") for _, step in dt_model.steps[:-1]):
+    raise RuntimeError("Decision Tree pipeline has non-sampler steps; cannot inline it")
+
+_dt_clf = dt_model.steps[-1][1]
+_dt_tree = _dt_clf.tree_
+
+# Flat node arrays for the compiled tree walk. Inputs are float32 and
+# thresholds stay float64, matching exactly how sklearn compares them.
+_dt_feature = _dt_tree.feature.astype(np.int32)
+_dt_threshold = _dt_tree.threshold.astype(np.float64)
+_dt_left = _dt_tree.children_left.astype(np.int32)
+_dt_right = _dt_tree.children_right.astype(np.int32)
+
+# Class label decided at each node (only leaf entries are ever read)
+_dt_leaf_class = _dt_clf.classes_.astype(np.int32)[
+    _dt_tree.value[:, 0, :].argmax(axis=1)
+]
+_dt_arrays = (_dt_feature, _dt_threshold, _dt_left, _dt_right, _dt_leaf_class)
+
+# Compile both kernels now so the first request doesn't pay for it
+walk_tree(np.zeros(len(dt_features), dtype=np.float32), *_dt_arrays)
+walk_tree_batch(np.zeros((1, len(dt_features)), dtype=np.float32), *_dt_arrays)
+
+# Check the compiled walk against dt_model.predict before serving it:
+# random rows built from the float32 values on and right next to each
+# split threshold (where a comparison or dtype slip would show up first),
+# plus every 0/1 feature combination while that stays small (2**16 rows).
+_dt_split = _dt_threshold[_dt_left != -1].astype(np.float32)
+_dt_probe_values = np.unique(np.concatenate([
+    [0.0, 1.0],
+    _dt_split,
+    np.nextafter(_dt_split, np.float32(-np.inf)),
+    np.nextafter(_dt_split, np.float32(np.inf)),
+])).astype(np.float32)
+_dt_n = len(dt_features)
+_dt_exhaustive = _dt_n <= 16
+_dt_probe = np.random.default_rng(0).choice(
+    _dt_probe_values, size=(4096 if _dt_exhaustive else 65536, _dt_n)
+)
+if _dt_exhaustive:
+    _dt_binary = (np.arange(2 ** _dt_n)[:, None] >> np.arange(_dt_n)) & 1
+    _dt_probe = np.vstack([_dt_binary.astype(np.float32), _dt_probe])
+if not np.array_equal(
+    walk_tree_batch(_dt_probe, *_dt_arrays),
+    dt_model.predict(_dt_probe).astype(np.int32),
+):
+    raise RuntimeError("Compiled tree walk disagrees with dt_model.predict")
 
 
 # ================================
 # REQUEST BODY SCHEMA
 # ================================
 
-class PredictRequest(BaseModel):
+# Feature values must be real numbers: NaN/inf (e.g. "nan", 1e400) would
+# otherwise flow into the compiled kernels and yield a silent prediction
+FiniteFloat = Annotated[float, Field(allow_inf_nan=False)]
+
+
+# One typed field per feature, generated from features.pkl so the schema
+# always matches the loaded model. Pydantic's Rust core checks that every
+# feature is present and a finite number while parsing the JSON, and
+# reports any problem per field. TypedDict keeps names like "Dx:Cancer"
+# as-is and still hands us a plain dict for the itemgetter.
+SvmFeatures = TypedDict("SvmFeatures", {f: FiniteFloat for f in svm_features})
+DtFeatures = TypedDict("DtFeatures", {f: FiniteFloat for f in dt_features})
+
+
+class SvmPredictRequest(BaseModel):
     """
     Expected input format from frontend.
 
@@ -97,45 +521,133 @@ class PredictRequest(BaseModel):
         }
     }
     """
-    data: dict
+    data: SvmFeatures
+
+
+class DtPredictRequest(BaseModel):
+    """
+    Same format as SvmPredictRequest, validated against
+    the Decision Tree's feature list.
+    """
+    data: DtFeatures
+
+
+# Upper bound on rows per batch request (keeps one request from hogging a worker)
+MAX_BATCH_SIZE = 1000
+
+
+class SvmBatchRequest(BaseModel):
+    """
+    Batch input format: a list of rows, each shaped like
+    the `data` object of a single prediction request.
+
+    Example:
+    {
+        "data": [
+            {"STDs": 0, "Dx:Cancer": 0, ...},
+            {"STDs": 1, "Dx:Cancer": 0, ...}
+        ]
+    }
+    """
+    data: List[SvmFeatures] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+class DtBatchRequest(BaseModel):
+    """
+    Same format as SvmBatchRequest, validated against
+    the Decision Tree's feature list.
+    """
+    data: List[DtFeatures] = Field(..., min_length=1, max_length=MAX_BATCH_SIZE)
+
+
+# Positional input for /predict/svm/v2: values must follow the exact
+# order of model_store/svm/features.pkl (see print_features.py).
+# The length is fixed from the loaded feature list at startup.
+PredictVecRequest = create_model(
+    "PredictVecRequest",
+    x=(
+        conlist(FiniteFloat, min_length=len(svm_features), max_length=len(svm_features)),
+        ...
+    ),
+)
 
 
 # ================================
 # HELPER FUNCTION
 # ================================
 
-def build_feature_vector(input_data: dict, feature_list: list):
+def build_feature_vector(input_data: dict, feature_list: list, getter, out=None):
     """
     Ensures:
     1. All required features are present
     2. Feature order matches training order exactly
 
     This is critical for correct ML predictions.
-    """
 
-    # Identify missing features
-    missing_features = [f for f in feature_list if f not in input_data]
+    `getter` is the precomputed itemgetter for `feature_list`.
+    If `out` is given, the values are written into it in place
+    instead of being returned as a tuple.
+    """
 
-    if missing_features:
+    try:
+        # Happy path: one C-level lookup of all features in order
+        values = getter(input_data)
+    except KeyError:
+        # The typed request schemas already reject missing features;
+        # this only guards direct callers passing a raw dict
+        missing = set(feature_list).difference(input_data)
+        missing_features = [f for f in feature_list if f in missing]
         raise HTTPException(
             status_code=400,
             detail=f"Missing features: {missing_features}"
         )
 
+    if out is not None:
+        out[:] = values
+        return out
+
     # Return features in correct order
-    return [input_data[f] for f in feature_list]
+    return values
+
+
+def build_feature_matrix(rows: list, feature_list: list, getter):
+    """
+    Stacks many input rows into one (n_rows, n_features) float32
+    matrix in training order, so the model is called only once.
+    """
+    X = np.empty((len(rows), len(feature_list)), dtype=np.float32)
+
+    for i, row in enumerate(rows):
+        build_feature_vector(row, feature_list, getter, out=X[i])
+
+    return X
 
 
 # ================================
-# GLOBAL ERROR HANDLER (RATE LIMIT)
+# PRECOMPUTED RESPONSES
 # ================================
 
-@app.exception_handler(RateLimitExceeded)
-async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
-    return JSONResponse(
-        status_code=429,
-        content={"detail": "Too many requests. Please try again later."}
-    )
+def prediction_responses(model_name: str, classes) -> dict:
+    """
+    Pre-renders the JSON body for every class a model can predict,
+    so single-row endpoints return ready bytes instead of serializing
+    a new dict per request.
+    """
+    return {
+        int(label): orjson.dumps({"model": model_name, "prediction": int(label)})
+        for label in classes
+    }
+
+
+_svm_responses = prediction_responses("SVM", _svm_classes)
+_dt_responses = prediction_responses("Decision Tree", _dt_clf.classes_)
+
+
+def json_bytes_response(body: bytes) -> Response:
+    """
+    Wraps already-encoded JSON without any further processing.
+    """
+    return Response(content=body, media_type="application/json")
 
 
 # ================================
@@ -154,27 +666,144 @@ def health_check():
 # SVM PREDICTION ENDPOINT
 # ================================
 
+# Screening forms often repeat the exact same answers (e.g. all zeros),
+# and the model is fixed for the life of the process, so predictions can
+# be memoized on the ordered feature tuple. If models are ever reloaded
+# at runtime, call _predict_svm.cache_clear().
+@functools.lru_cache(maxsize=4096)
+def _predict_svm(values: tuple) -> int:
+    """
+    SVM inference for one row given in training order.
+
+    The buffer is filled and used without yielding to the
+    event loop, so no other request can touch it in between.
+    """
+    x = scratch_buffer("svm", len(svm_features))
+    x[0] = values
+
+    # Perform prediction (scaling is folded into the model parameters)
+    return int(svm_predict(x)[0])
+
+
+class SvmMicroBatcher:
+    """
+    Collects concurrent single-row SVM requests and scores them
+    together, so the per-call cost is paid once per batch.
+
+    A background task takes the first queued row, waits up to
+    `max_wait` seconds for more (stopping early at `max_batch`),
+    scores the stacked rows in one call on a worker thread and
+    resolves each request's future with its own prediction.
+    """
+
+    def __init__(self, max_batch: int, max_wait: float):
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue()
+        self.task = None
+        # Rows taken off the queue but not yet answered
+        self.in_flight = []
+
+    def start(self):
+        self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        self.task.cancel()
+        try:
+            await self.task
+        except asyncio.CancelledError:
+            pass
+
+        # Don't leave callers waiting forever on a stopped batcher
+        while not self.queue.empty():
+            self.in_flight.append(self.queue.get_nowait())
+        for _, future in self.in_flight:
+            if not future.done():
+                future.cancel()
+        self.in_flight = []
+
+    async def predict(self, values: tuple) -> int:
+        future = asyncio.get_running_loop().create_future()
+        self.queue.put_nowait((values, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+
+        while True:
+            items = self.in_flight = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            # Gather more rows until the batch is full or the wait is over
+            while len(items) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    items.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                X = np.array([values for values, _ in items], dtype=np.float32)
+                predictions = (await run_in_threadpool(svm_predict, X)).tolist()
+            except Exception as exc:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+
+            for (_, future), prediction in zip(items, predictions):
+                # Skip requests whose client already went away
+                if not future.done():
+                    future.set_result(prediction)
+            self.in_flight = []
+
+
+async def predict_svm_row(values: tuple) -> int:
+    """
+    Scores one ordered SVM row, through the micro-batcher
+    when it is enabled and the memoized path otherwise.
+    """
+    if _svm_batcher is not None:
+        return await _svm_batcher.predict(values)
+    return _predict_svm(values)
+
+
 @app.post("/predict/svm")
-@limiter.limit("10/minute")
-def predict_svm(request: Request, payload: PredictRequest):
+async def predict_svm(request: Request, payload: SvmPredictRequest):
     """
     Uses the trained Support Vector Machine (SVM) model
     to predict cervical cancer risk.
     """
+    check_rate_limit(request)
 
-    # Build ordered feature vector
-    x = build_feature_vector(payload.data, svm_features)
+    # Build ordered feature vector (a hashable tuple)
+    x = build_feature_vector(payload.data, svm_features, _svm_getter)
 
-    # Apply scaling (required for SVM)
-    x_scaled = svm_scaler.transform([x])
+    # The compiled decision function takes microseconds, so it
+    # runs directly instead of hopping to a worker thread
+    prediction = await predict_svm_row(x)
 
-    # Perform prediction
-    prediction = svm_model.predict(x_scaled)[0]
+    return json_bytes_response(_svm_responses[prediction])
 
-    return {
-        "model": "SVM",
-        "prediction": int(prediction)
+
+@app.post("/predict/svm/v2")
+async def predict_svm_v2(request: Request, payload: PredictVecRequest):
+    """
+    Same as /predict/svm, but takes an ordered list of feature
+    values instead of a name -> value object.
+
+    Example:
+    {
+        "x": [0, 0, 0, 0, 0, 0, 0, 0, 1, 0]
     }
+    """
+    check_rate_limit(request)
+
+    prediction = await predict_svm_row(tuple(payload.x))
+
+    return json_bytes_response(_svm_responses[prediction])
 
 
 # ================================
@@ -182,20 +811,75 @@ def predict_svm(request: Request, payload: PredictRequest):
 # ================================
 
 @app.post("/predict/dt")
-@limiter.limit("10/minute")
-def predict_dt(request: Request, payload: PredictRequest):
+async def predict_dt(request: Request, payload: DtPredictRequest):
     """
     Uses the trained Decision Tree model
     to predict cervical cancer risk.
     """
+    check_rate_limit(request)
 
-    # Build ordered feature vector
-    x = build_feature_vector(payload.data, dt_features)
+    # Build ordered feature vector directly into this thread's buffer
+    # (no await before the walk, so no other request can touch it)
+    x = scratch_buffer("dt", len(dt_features))[0]
+    build_feature_vector(payload.data, dt_features, _dt_getter, out=x)
 
-    # Decision Trees do NOT require scaling
-    prediction = dt_model.predict([x])[0]
+    # Decision Trees do NOT require scaling. The compiled walk is a
+    # handful of comparisons, so it runs inline without a thread hop.
+    prediction = walk_tree(x, *_dt_arrays)
 
-    return {
+    return json_bytes_response(_dt_responses[int(prediction)])
+
+
+# ================================
+# BATCH PREDICTION ENDPOINTS
+# ================================
+
+def _predict_svm_batch(rows: list) -> list:
+    """
+    Blocking SVM inference for many rows: one
+    decision-function call for the whole batch.
+    """
+    X = build_feature_matrix(rows, svm_features, _svm_getter)
+    return svm_predict(X).tolist()
+
+
+def _predict_dt_batch(rows: list) -> list:
+    """
+    Blocking Decision Tree inference for many rows.
+    """
+    X = build_feature_matrix(rows, dt_features, _dt_getter)
+    return walk_tree_batch(X, *_dt_arrays).tolist()
+
+
+@app.post("/predict/svm/batch")
+async def predict_svm_batch(request: Request, payload: SvmBatchRequest):
+    """
+    Predicts cervical cancer risk for several patients
+    at once using the SVM model.
+    """
+    check_rate_limit(request)
+
+    predictions = await run_in_threadpool(_predict_svm_batch, payload.data)
+
+    # Returning the response directly skips FastAPI's jsonable_encoder pass
+    return ORJSONResponse({
+        "model": "SVM",
+        "predictions": predictions
+    })
+
+
+@app.post("/predict/dt/batch")
+async def predict_dt_batch(request: Request, payload: DtBatchRequest):
+    """
+    Predicts cervical cancer risk for several patients
+    at once using the Decision Tree model.
+    """
+    check_rate_limit(request)
+
+    predictions = await run_in_threadpool(_predict_dt_batch, payload.data)
+
+    # Returning the response directly skips FastAPI's jsonable_encoder pass
+    return ORJSONResponse({
         "model": "Decision Tree",
-        "prediction": int(prediction)
-    }
+        "predictions": predictions
+    })
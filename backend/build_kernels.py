@@ -0,0 +1,36 @@
+# ================================
+# AHEAD-OF-TIME KERNEL BUILD
+# ================================
+
+# Compiles the single-row Decision Tree walk in app/kernels.py into a
+# native extension module (app/cervix_kernels.*.so). When it exists, the
+# API imports it instead of JIT-compiling that walk. The batch walk stays
+# JIT (parallel and nogil), see app/kernels.py.
+#
+# Run from the backend/ directory as part of the build step:
+#     python build_kernels.py
+
+import os
+
+from numba.pycc import CC
+
+from app.kernels import jit_walk_tree
+
+cc = CC("cervix_kernels")
+cc.output_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app")
+
+# Argument types match the arrays prepared in app/main.py:
+#   x          float32 input row, C-contiguous
+#   feature    int32 split feature per node
+#   threshold  float64 split threshold per node (same precision as sklearn)
+#   left/right int32 child node indices (-1 at leaves)
+#   leaf       int32 class label per node
+cc.export(
+    "walk_tree",
+    "i4(f4[::1], i4[::1], f8[::1], i4[::1], i4[::1], i4[::1])"
+)(jit_walk_tree.py_func)
+
+
+if __name__ == "__main__":
+    cc.compile()
+    print("Built", os.path.join(cc.output_dir, cc.output_file))